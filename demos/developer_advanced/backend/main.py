@@ -1,15 +1,31 @@
+import os
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 app = FastAPI()
 
 @app.get("/")
-def read_root():
-    return {"message": "Hello World"}
+async def read_root():
+    # Returning the response directly skips jsonable_encoder
+    return ORJSONResponse({"message": "Hello World"})
 
 @app.get("/items/{item_id}")
-def read_item(item_id: int):
-    return {"item_id": item_id, "description": "This is a heavy item that needs rate limiting."}
+async def read_item(item_id: int):
+    return ORJSONResponse({"item_id": item_id, "description": "This is a heavy item that needs rate limiting."})
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http "auto" pick uvloop + httptools when installed (`pip install "uvicorn[standard]"`);
+    # uvloop is unavailable on Windows, where asyncio is used instead.
+    # Single worker by default: in-memory rate limiting (slowapi) keeps one counter per process.
+    # Set WEB_CONCURRENCY to fork one worker (and event loop) per core from the import string.
+    # In containers, prefer: gunicorn main:app -k uvicorn.workers.UvicornWorker -w $(nproc) -b 0.0.0.0:8000
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        loop="auto",
+        http="auto",
+    )
@@ -10,7 +10,122 @@ parameters:
 """
 import sys
 import csv
+import codecs
 import os
+from itertools import repeat
+
+CHUNK_SIZE = 1 << 20
+
+
+def _count_columns(line):
+    """
+    Counts columns in a raw CSV line without decoding it.
+    """
+    line = line.rstrip(b'\r\n')
+    return line.count(b',') + 1 if line else 0
+
+
+def _has_bare_cr(data):
+    """
+    Whether data holds a carriage return that is not part of a CRLF pair.
+    A trailing CR is allowed, its LF may start the next chunk.
+    """
+    crs = data.count(b'\r')
+    return crs > 0 and crs != data.count(b'\r\n') + data.endswith(b'\r')
+
+
+def _validate_with_csv_module(filepath, start=0, ncols=None, row_count=0):
+    """
+    Exact validation through the csv module, used when the fast path cannot decide.
+    Resumes at byte offset `start` (a line start) when the rows before it are known.
+    """
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        if start:
+            f.seek(start)
+        reader = csv.reader(f)
+        if ncols is None:
+            header = next(reader, None)
+            if header is None:
+                return None, "Error: Empty CSV file."
+            ncols = len(header)
+
+        for row in reader:
+            row_count += 1
+            if len(row) != ncols:
+                return None, f"Error: Row {row_count + 1} has {len(row)} columns, expected {ncols}."
+
+        return (row_count, ncols), None
+
+
+def _validate_fast(filepath):
+    """
+    Streams the file in binary chunks, validating UTF-8 incrementally and
+    checking the comma count of every line in a chunk at once.
+    Quoting, bare carriage returns and column mismatches are handed to the csv
+    module from the start of the chunk where they occur; invalid UTF-8 reruns
+    the csv module from the top so the reported error is the same.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(filepath, 'rb') as f:
+        header = f.readline()
+        if not header:
+            return None, "Error: Empty CSV file."
+        if b'"' in header or _has_bare_cr(header.rstrip(b'\n')):
+            return _validate_with_csv_module(filepath)
+        try:
+            decoder.decode(header)
+        except UnicodeDecodeError:
+            return _validate_with_csv_module(filepath)
+        ncols = _count_columns(header)
+        commas = ncols - 1
+
+        offset = len(header)
+        row_count = 0
+        resume = None
+        carry = b''
+        while chunk := f.read(CHUNK_SIZE):
+            try:
+                decoder.decode(chunk)
+            except UnicodeDecodeError:
+                return _validate_with_csv_module(filepath)
+
+            data_start = offset - len(carry)
+            offset += len(chunk)
+            if resume is not None:
+                # Keep reading only to finish the UTF-8 check
+                continue
+
+            data = carry + chunk
+            lines = data.split(b'\n')
+            carry = lines.pop()
+            if b'"' in data or _has_bare_cr(data):
+                resume = data_start, row_count
+                continue
+
+            counts = set(map(bytes.count, lines, repeat(b',')))
+            blank = ncols == 1 and (b'' in lines or b'\r' in lines)
+            if blank or (lines and counts != {commas}):
+                resume = data_start, row_count
+                continue
+            row_count += len(lines)
+
+        try:
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            return _validate_with_csv_module(filepath)
+
+    if resume is None and carry:
+        if _count_columns(carry) != ncols:
+            resume = offset - len(carry), row_count
+        else:
+            row_count += 1
+
+    if resume is not None:
+        start, rows = resume
+        return _validate_with_csv_module(filepath, start, ncols, rows)
+
+    return (row_count, ncols), None
+
 
 def validate_csv(filepath):
     """
@@ -21,21 +136,13 @@ def validate_csv(filepath):
         sys.exit(1)
 
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader, None)
-            if header is None:
-                print("Error: Empty CSV file.")
-                sys.exit(1)
-
-            row_count = 0
-            for row in reader:
-                row_count += 1
-                if len(row) != len(header):
-                    print(f"Error: Row {row_count + 1} has {len(row)} columns, expected {len(header)}.")
-                    sys.exit(1)
+        counts, error = _validate_fast(filepath)
+        if error:
+            print(error)
+            sys.exit(1)
 
-            print(f"Success: Valid CSV. {row_count} rows, {len(header)} columns.")
+        row_count, column_count = counts
+        print(f"Success: Valid CSV. {row_count} rows, {column_count} columns.")
     except Exception as e:
         print(f"Error: {str(e)}")
         sys.exit(1)
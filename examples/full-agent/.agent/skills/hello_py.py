@@ -1,16 +1,20 @@
 import sys
-import json
 import os
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 def main():
     # Read from stdin
-    input_data = sys.stdin.read()
+    input_data = sys.stdin.buffer.read()
     if input_data:
-        args = json.loads(input_data)
+        args = loads(input_data)
     else:
         # Fallback to env var
         input_env = os.environ.get('TOOL_INPUT')
-        args = json.loads(input_env) if input_env else {}
+        args = loads(input_env) if input_env else {}
 
     name = args.get('name', 'Stranger')
     print(f"Python says: Hello {name}!")
@@ -1,6 +1,9 @@
 import sys
 import json
 import os
+import sqlite3
+import functools
+from contextlib import closing
 
 # Check for required packages
 try:
@@ -13,47 +16,87 @@ except ImportError:
     }))
     sys.exit(1)
 
+@functools.lru_cache(maxsize=None)
+def get_db_path():
+    # Ensure .agent directory exists
+    agent_dir = os.path.join(os.getcwd(), ".agent")
+    os.makedirs(agent_dir, exist_ok=True)
+    db_path = os.path.join(agent_dir, "agno.db")
+
+    # WAL is persisted in the database file, so setting it once covers every connection
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+    return db_path
+
+@functools.lru_cache(maxsize=None)
+def get_model():
+    return OpenAIChat(
+        id=os.environ.get("OPENAI_MODEL_NAME", "gpt-4o"),
+        base_url=os.environ.get("OPENAI_BASE_URL")
+    )
+
+@functools.lru_cache(maxsize=None)
+def get_db(table_name):
+    return SqliteDb(db_file=get_db_path(), table_name=table_name)
+
+def build_agent(user_id, session_id=None):
+    # Initialize Agent with persistent memory (storage) and knowledge (learning)
+    # Note: 'learning=True' enables long-term memory about the user.
+    return Agent(
+        model=get_model(),
+        storage=get_db("agent_sessions"),
+        db=get_db("agent_knowledge"), # For learning/knowledge
+        session_id=session_id,
+        user_id=user_id,
+        read_chat_history=True,   # Remember previous messages in session
+        add_history_to_messages=True,
+        # learning=True, # Enable if supported by installed version, safer to assume standard memory first
+        description="You are a helpful assistant with persistent memory. You remember details about the user.",
+        instructions=["Always check your memory for details about the user before answering."]
+    )
+
+@functools.lru_cache(maxsize=128)
+def get_session_agent(user_id, session_id):
+    return build_agent(user_id, session_id)
+
+def run_chat(user_id, message, session_id=None):
+    # Without a session_id agno generates one and keeps it on the instance,
+    # so only agents for explicit sessions are reused
+    agent = get_session_agent(user_id, session_id) if session_id else build_agent(user_id)
+    response = agent.run(message)
+    return response.content if hasattr(response, 'content') else str(response)
+
+def serve():
+    """
+    Long-lived mode: one JSON request per stdin line, one JSON response per stdout line.
+    Request format: { "user_id": "...", "message": "...", "session_id": "..." }
+    """
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            content = run_chat(request["user_id"], request["message"], request.get("session_id"))
+            print(json.dumps({"content": content}), flush=True)
+        except Exception as e:
+            print(json.dumps({"error": f"Execution failed: {str(e)}"}), flush=True)
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+        serve()
+        return
+
     if len(sys.argv) < 3:
-        print(json.dumps({"error": "Usage: python agent.py <user_id> <message> [session_id]"}), file=sys.stderr)
+        print(json.dumps({"error": "Usage: python agent.py <user_id> <message> [session_id] | --serve"}), file=sys.stderr)
         sys.exit(1)
 
     user_id = sys.argv[1]
     message = sys.argv[2]
     session_id = sys.argv[3] if len(sys.argv) > 3 else None
 
-    # Ensure .agent directory exists
-    agent_dir = os.path.join(os.getcwd(), ".agent")
-    os.makedirs(agent_dir, exist_ok=True)
-    db_path = os.path.join(agent_dir, "agno.db")
-
     try:
-        # Initialize Agent with persistent memory (storage) and knowledge (learning)
-        # Note: 'learning=True' enables long-term memory about the user.
-        agent = Agent(
-            model=OpenAIChat(
-                id=os.environ.get("OPENAI_MODEL_NAME", "gpt-4o"),
-                base_url=os.environ.get("OPENAI_BASE_URL")
-            ),
-            storage=SqliteDb(db_file=db_path, table_name="agent_sessions"),
-            db=SqliteDb(db_file=db_path, table_name="agent_knowledge"), # For learning/knowledge
-            session_id=session_id,
-            user_id=user_id,
-            read_chat_history=True,   # Remember previous messages in session
-            add_history_to_messages=True,
-            # learning=True, # Enable if supported by installed version, safer to assume standard memory first
-            description="You are a helpful assistant with persistent memory. You remember details about the user.",
-            instructions=["Always check your memory for details about the user before answering."]
-        )
-
-        # Run agent
-        response = agent.run(message)
-
         # Output the response content
-        if hasattr(response, 'content'):
-            print(response.content)
-        else:
-            print(str(response))
+        print(run_chat(user_id, message, session_id))
 
     except Exception as e:
         print(json.dumps({"error": f"Execution failed: {str(e)}"}), file=sys.stderr)
@@ -39,12 +39,11 @@ def main():
             max_consecutive_auto_reply=1
         )
 
-        # Capture stdout to avoid polluting MCP output if we want clean JSON
-        import io
+        # Discard stdout to avoid polluting MCP output if we want clean JSON
+        # (the printed chat is never read back, so don't buffer it in memory)
         from contextlib import redirect_stdout
 
-        f = io.StringIO()
-        with redirect_stdout(f):
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
             user_proxy.initiate_chat(assistant, message=task)
 
         # Get history
@@ -56,11 +55,10 @@ def main():
         last_msg = history[-1]['content']
 
         # Also return the full conversation as text
-        full_conversation = ""
-        for msg in history:
-            role = msg.get('role', 'unknown')
-            content = msg.get('content', '')
-            full_conversation += f"{role}: {content}\n\n"
+        full_conversation = "".join(
+            f"{msg.get('role', 'unknown')}: {msg.get('content', '')}\n\n"
+            for msg in history
+        )
 
         print(json.dumps({
             "result": last_msg,
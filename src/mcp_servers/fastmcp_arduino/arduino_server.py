@@ -1,8 +1,25 @@
 import sys
+import io
 import json
 import time
 import random
 
+# Prefer orjson for the per-message encode/decode, fall back to the stdlib
+try:
+    import orjson
+
+    dumps = orjson.dumps
+    loads = orjson.loads
+except ImportError:
+    def dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    loads = json.loads
+
+def emit(obj):
+    sys.stdout.buffer.write(dumps(obj) + b"\n")
+    sys.stdout.flush()
+
 # Try to import pyfirmata2, otherwise mock it
 try:
     import pyfirmata2
@@ -12,19 +29,26 @@ except ImportError:
 
 class ArduinoController:
     def __init__(self):
+        global USE_MOCK
         self.board = None
         self.pins = {}
+        self._handlers = {
+            "led_on": self._led_on,
+            "led_off": self._led_off,
+            "motor_move": self._motor_move,
+            "get_pin_status": self._get_pin_status,
+        }
         if not USE_MOCK:
             try:
                 # Auto-detect port
                 self.board = pyfirmata2.Arduino(pyfirmata2.Arduino.AUTODETECT)
-                print(json.dumps({"type": "log", "message": "Connected to Arduino via pyfirmata2"}), flush=True)
+                emit({"type": "log", "message": "Connected to Arduino via pyfirmata2"})
             except Exception as e:
-                print(json.dumps({"type": "error", "message": f"Failed to connect to Arduino: {e}. Falling back to mock."}), flush=True)
+                emit({"type": "error", "message": f"Failed to connect to Arduino: {e}. Falling back to mock."})
                 USE_MOCK = True
 
         if USE_MOCK:
-            print(json.dumps({"type": "log", "message": "Running in MOCK mode"}), flush=True)
+            emit({"type": "log", "message": "Running in MOCK mode"})
 
     def process_command(self, command):
         cmd_type = command.get("command")
@@ -34,61 +58,66 @@ class ArduinoController:
         if req_id is not None:
             response["id"] = req_id
 
-        if cmd_type == "led_on":
-            pin = command.get("pin", 13)
-            if not USE_MOCK and self.board:
-                self.board.digital[pin].write(1)
-            response.update({"status": "success", "message": f"LED on pin {pin} turned ON"})
-
-        elif cmd_type == "led_off":
-            pin = command.get("pin", 13)
-            if not USE_MOCK and self.board:
-                self.board.digital[pin].write(0)
-            response.update({"status": "success", "message": f"LED on pin {pin} turned OFF"})
-
-        elif cmd_type == "motor_move":
-            pin = command.get("pin", 9)
-            angle = command.get("angle", 0)
-            if not USE_MOCK and self.board:
-                # Assuming servo attached to pin
-                self.board.digital[pin].write(angle)
-            response.update({"status": "success", "message": f"Motor on pin {pin} moved to {angle} degrees"})
-
-        elif cmd_type == "get_pin_status":
-            pin = command.get("pin")
-            mode = command.get("mode", "digital") # digital or analog
-
-            val = 0
-            if not USE_MOCK and self.board:
-                 # Read logic (simplified)
-                 pass
-            else:
-                 val = random.randint(0, 1) if mode == "digital" else random.randint(0, 1023)
-
-            response.update({"status": "success", "value": val, "pin": pin})
-
+        handler = self._handlers.get(cmd_type)
+        if handler:
+            response.update(handler(command))
         else:
             response.update({"status": "error", "message": "Unknown command"})
 
         return response
 
+    def _led_on(self, command):
+        pin = command.get("pin", 13)
+        if not USE_MOCK and self.board:
+            self.board.digital[pin].write(1)
+        return {"status": "success", "message": f"LED on pin {pin} turned ON"}
+
+    def _led_off(self, command):
+        pin = command.get("pin", 13)
+        if not USE_MOCK and self.board:
+            self.board.digital[pin].write(0)
+        return {"status": "success", "message": f"LED on pin {pin} turned OFF"}
+
+    def _motor_move(self, command):
+        pin = command.get("pin", 9)
+        angle = command.get("angle", 0)
+        if not USE_MOCK and self.board:
+            # Assuming servo attached to pin
+            self.board.digital[pin].write(angle)
+        return {"status": "success", "message": f"Motor on pin {pin} moved to {angle} degrees"}
+
+    def _get_pin_status(self, command):
+        pin = command.get("pin")
+        mode = command.get("mode", "digital") # digital or analog
+
+        val = 0
+        if not USE_MOCK and self.board:
+             # Read logic (simplified)
+             pass
+        else:
+             val = random.randint(0, 1) if mode == "digital" else random.randint(0, 1023)
+
+        return {"status": "success", "value": val, "pin": pin}
+
 def main():
     controller = ArduinoController()
+    # Read raw bytes: both parsers accept bytes and ignore the trailing newline
+    stdin = io.open(sys.stdin.fileno(), "rb", buffering=1 << 16, closefd=False)
 
     while True:
         try:
-            line = sys.stdin.readline()
+            line = stdin.readline()
             if not line:
                 break
 
-            command = json.loads(line.strip())
+            command = loads(line)
             result = controller.process_command(command)
-            print(json.dumps(result), flush=True)
+            emit(result)
 
         except json.JSONDecodeError:
-            print(json.dumps({"status": "error", "message": "Invalid JSON"}), flush=True)
+            emit({"status": "error", "message": "Invalid JSON"})
         except Exception as e:
-            print(json.dumps({"status": "error", "message": str(e)}), flush=True)
+            emit({"status": "error", "message": str(e)})
 
 if __name__ == "__main__":
     main()
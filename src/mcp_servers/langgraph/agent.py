@@ -1,6 +1,7 @@
 import sys
 import json
 import os
+import functools
 from typing import TypedDict, Annotated, List
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
@@ -11,14 +12,26 @@ import operator
 class AgentState(TypedDict):
     messages: Annotated[List[BaseMessage], operator.add]
 
-def call_model(state):
-    messages = state['messages']
+@functools.lru_cache(maxsize=None)
+def get_llm():
+    # Built once and reused so the HTTP client and its connection pool survive across calls
     # Default to gpt-4o or use environment variable if set
     model_name = os.environ.get("OPENAI_MODEL_NAME", "gpt-4o")
-    llm = ChatOpenAI(temperature=0, model=model_name)
-    response = llm.invoke(messages)
+    return ChatOpenAI(temperature=0, model=model_name)
+
+def call_model(state):
+    messages = state['messages']
+    response = get_llm().invoke(messages)
     return {"messages": [response]}
 
+# The graph is static, so compile it once at import time
+workflow = StateGraph(AgentState)
+workflow.add_node("agent", call_model)
+workflow.set_entry_point("agent")
+workflow.add_edge("agent", END)
+
+app = workflow.compile()
+
 def main():
     if len(sys.argv) < 2:
         # If no arguments, just exit (could be a check run)
@@ -31,13 +44,6 @@ def main():
          sys.exit(1)
 
     try:
-        workflow = StateGraph(AgentState)
-        workflow.add_node("agent", call_model)
-        workflow.set_entry_point("agent")
-        workflow.add_edge("agent", END)
-
-        app = workflow.compile()
-
         inputs = {"messages": [HumanMessage(content=task)]}
         result = app.invoke(inputs)
 
@@ -1,6 +1,7 @@
 import sys
 import json
 import os
+import functools
 from typing import Dict, Any, Type
 
 # Check for required packages
@@ -17,7 +18,14 @@ def create_dynamic_model(schema_def: Dict[str, Any]) -> Type[BaseModel]:
     """
     Creates a Pydantic model dynamically from a simplified schema definition.
     Schema format: { "field_name": { "type": "str|int|float|bool", "description": "..." } }
+    Repeated schemas share one cached model class; the key keeps field order,
+    which is the order of the generated schema and of the output.
     """
+    return _build_model(json.dumps(schema_def))
+
+@functools.lru_cache(maxsize=128)
+def _build_model(schema_json: str) -> Type[BaseModel]:
+    schema_def = json.loads(schema_json)
     fields = {}
     type_map = {
         "str": str,
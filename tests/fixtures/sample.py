@@ -3,6 +3,8 @@
 class Person:
     """A simple person class."""
     
+    __slots__ = ('name', 'age')
+    
     def __init__(self, name: str, age: int):
         self.name = name
         self.age = age